@@ -0,0 +1,131 @@
+"""CSV-backed storage for the reusable containers demo.
+
+Kept separate from the Streamlit app so it can be imported without running the UI.
+"""
+import pandas as pd
+import os
+import ast
+
+# ---------- CSV FILES ----------
+USERS_FILE = "users.csv"
+OPERATORS_FILE = "operators.csv"
+RESTAURANTS_FILE = "restaurants.csv"
+CONTAINERS_FILE = "containers.csv"
+ORDERS_FILE = "orders.csv"
+REQUESTS_FILE = "requests.csv"   # new file for restaurant container requests
+
+# ---------- INITIALIZATION ----------
+def init_csv():
+    if not os.path.exists(USERS_FILE):
+        pd.DataFrame([
+            {"phone": "91234567", "password": "pass123", "points": 0},
+            {"phone": "98765432", "password": "secret", "points": 0}
+        ]).to_csv(USERS_FILE, index=False)
+    if not os.path.exists(OPERATORS_FILE):
+        pd.DataFrame([
+            {"phone": "90001111", "password": "op123"},
+            {"phone": "90002222", "password": "op456"}
+        ]).to_csv(OPERATORS_FILE, index=False)
+    if not os.path.exists(RESTAURANTS_FILE):
+        # If restaurants.csv already exists in your workspace, this won't overwrite.
+        pd.DataFrame([
+            {"phone": "80001111", "password": "restA", "name": "Restaurant A"},
+            {"phone": "80002222", "password": "restB", "name": "Restaurant B"}
+        ]).to_csv(RESTAURANTS_FILE, index=False)
+    if not os.path.exists(CONTAINERS_FILE):
+        pd.DataFrame([
+            {"id": "C001", "status": "CLEAN", "hoursInUse": 0, "timesUsed": 0,
+             "owner": "", "deposit": 0.0, "history": "[]"}
+        ]).to_csv(CONTAINERS_FILE, index=False)
+    if not os.path.exists(ORDERS_FILE):
+        pd.DataFrame(columns=["customer_phone", "restaurant_phone", "order_text", "status", "containers"]) \
+          .to_csv(ORDERS_FILE, index=False)
+    if not os.path.exists(REQUESTS_FILE):
+        # requests: restaurant_phone, num_requested, status (OPEN / FULFILLED), created_at
+        pd.DataFrame(columns=["restaurant_phone", "num_requested", "status", "created_at"]).to_csv(REQUESTS_FILE, index=False)
+
+# ---------- LOAD / SAVE ----------
+def load_users():
+    df = pd.read_csv(USERS_FILE, dtype=str).map(lambda x: x.strip() if isinstance(x, str) else x)
+    df["points"] = df["points"].astype(int)
+    return df
+
+def save_users(df):
+    df.to_csv(USERS_FILE, index=False)
+
+def load_operators():
+    df = pd.read_csv(OPERATORS_FILE, dtype=str).map(lambda x: x.strip() if isinstance(x, str) else x)
+    return df
+
+def load_restaurants():
+    df = pd.read_csv(RESTAURANTS_FILE, dtype=str).map(lambda x: x.strip() if isinstance(x, str) else x)
+    return df
+
+def load_orders():
+    if not os.path.exists(ORDERS_FILE):
+        pd.DataFrame(columns=["customer_phone", "restaurant_phone", "order_text", "status", "containers"]).to_csv(ORDERS_FILE, index=False)
+    return pd.read_csv(ORDERS_FILE, dtype=str)
+
+def save_orders(df):
+    df.to_csv(ORDERS_FILE, index=False)
+
+def load_requests():
+    if not os.path.exists(REQUESTS_FILE):
+        pd.DataFrame(columns=["restaurant_phone", "num_requested", "status", "created_at"]).to_csv(REQUESTS_FILE, index=False)
+    df = pd.read_csv(REQUESTS_FILE, dtype=str).map(lambda x: x.strip() if isinstance(x, str) else x)
+    return df
+
+def save_requests(df):
+    df.to_csv(REQUESTS_FILE, index=False)
+
+def load_containers():
+    df = pd.read_csv(CONTAINERS_FILE, dtype=str).map(lambda x: x.strip() if isinstance(x, str) else x)
+    # ensure columns types
+    df["hoursInUse"] = df["hoursInUse"].astype(int)
+    df["timesUsed"] = df["timesUsed"].astype(int)
+    df["deposit"] = df["deposit"].astype(float)
+    df["history"] = df["history"].apply(lambda x: ast.literal_eval(x) if x else [])
+    return df
+
+def save_containers(df):
+    df["history"] = df["history"].apply(str)
+    df.to_csv(CONTAINERS_FILE, index=False)
+
+def calc_points(hours, clean=True):
+    base = max(0, (168 - hours) * 1000 / 168)
+    return int(base if clean else base / 2)
+
+# ---------- VIEW QUERIES ----------
+# Filters the Streamlit views run on every rerun, kept here so benchmarks time the same code.
+def find_login(df, phone, password):
+    return df[(df["phone"] == phone) & (df["password"] == password)]
+
+def find_by_phone(df, phone):
+    return df[df["phone"] == phone]
+
+def containers_owned_by(containers, phone):
+    return containers[containers["owner"] == phone]
+
+def restaurant_stock(containers, phone):
+    return containers[(containers["status"] == "DISTRIBUTED") & (containers["owner"] == phone)]
+
+def take_clean_containers(containers, n):
+    return containers[containers["status"] == "CLEAN"].head(n)
+
+def search_containers(containers, search):
+    return containers[containers["id"].str.contains(search)] if search else containers
+
+def count_by_status(containers):
+    return containers["status"].value_counts()
+
+def orders_for_customer(orders, phone):
+    return orders[orders["customer_phone"] == phone]
+
+def orders_for_restaurant(orders, phone):
+    return orders[orders["restaurant_phone"] == phone].iloc[::-1]  # latest first
+
+def pending_only(orders):
+    return orders[orders["status"] == "PENDING"]
+
+def open_requests_latest_first(requests):
+    return requests[requests["status"] == "OPEN"].iloc[::-1]
@@ -0,0 +1,215 @@
+"""Deterministic synthetic data generator for the reusable containers demo.
+
+Writes users.csv, operators.csv, restaurants.csv, containers.csv, orders.csv
+and requests.csv in the same schemas that load_users / load_containers /
+load_orders / load_requests in data_io.py read, so the app can be
+exercised at production-like scale.
+
+Usage:
+    python generate_synthetic_data.py --tier 100k
+    python generate_synthetic_data.py --tier 1m --out synthetic_data/1m --seed 7
+
+The same tier + seed always produces byte-identical files. To run the app
+against a generated fleet, copy the CSVs over the ones next to
+reusable_containers_demo.py (the app reads them from the working directory).
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# ---------- SCALE TIERS ----------
+# containers, users (customers), restaurants, orders, requests
+TIERS = {
+    "1k":   {"containers": 1_000,      "users": 200,       "restaurants": 10,     "orders": 2_000,      "requests": 50},
+    "10k":  {"containers": 10_000,     "users": 2_000,     "restaurants": 50,     "orders": 20_000,     "requests": 500},
+    "100k": {"containers": 100_000,    "users": 20_000,    "restaurants": 250,    "orders": 200_000,    "requests": 5_000},
+    "1m":   {"containers": 1_000_000,  "users": 200_000,   "restaurants": 1_000,  "orders": 2_000_000,  "requests": 50_000},
+    "10m":  {"containers": 10_000_000, "users": 2_000_000, "restaurants": 5_000,  "orders": 20_000_000, "requests": 500_000},
+}
+
+# ---------- SCHEMAS (must match data_io.py) ----------
+USERS_COLUMNS = ["phone", "password", "points"]
+OPERATORS_COLUMNS = ["phone", "password"]
+RESTAURANTS_COLUMNS = ["phone", "password", "name"]
+CONTAINERS_COLUMNS = ["id", "status", "hoursInUse", "timesUsed", "owner", "deposit", "history", "startTime"]
+ORDERS_COLUMNS = ["customer_phone", "restaurant_phone", "order_text", "status", "containers"]
+REQUESTS_COLUMNS = ["restaurant_phone", "restaurant_name", "num_requested", "status", "created_at"]
+
+# Rough fleet mix: most containers sit clean in the depot or are out with customers.
+CONTAINER_STATUSES = np.array(["CLEAN", "DISTRIBUTED", "IN_USE", "RETURNED"])
+CONTAINER_STATUS_WEIGHTS = [0.40, 0.20, 0.30, 0.10]
+DEPOSIT = 3.0
+MAX_HOURS = 168  # calc_points gives nothing back after a week
+
+ORDER_STATUSES = np.array(["PENDING", "DELIVERED"])
+ORDER_STATUS_WEIGHTS = [0.1, 0.9]
+ORDER_TEXTS = np.array([
+    "Chicken rice, no chilli", "Laksa x2", "Nasi lemak with extra egg",
+    "Char kway teow", "Fish soup, less salt", "Mee goreng", "Roti prata x3",
+    "Wonton noodles dry", "Hokkien mee", "Vegetarian bee hoon",
+])
+
+REQUEST_STATUSES = np.array(["OPEN", "FULFILLED"])
+REQUEST_STATUS_WEIGHTS = [0.2, 0.8]
+
+# Rows generated per pass for the large tables, keeps memory flat on the 10m tier.
+CHUNK_SIZE = 250_000
+
+
+# ---------- HELPERS ----------
+def customer_phones(n):
+    # Start at 91000000 so customers never reuse the 9000xxxx operator numbers.
+    return np.array([f"9{i + 1_000_000:07d}" for i in range(n)])
+
+def restaurant_phones(n):
+    return np.array([f"8{i:07d}" for i in range(n)])
+
+def write_chunks(path, columns, chunks):
+    """Write an iterable of DataFrames to one CSV, header on the first chunk only."""
+    with open(path, "w", newline="") as f:
+        pd.DataFrame(columns=columns).to_csv(f, index=False)
+        for chunk in chunks:
+            chunk[columns].to_csv(f, index=False, header=False)
+
+def chunk_bounds(total):
+    for start in range(0, total, CHUNK_SIZE):
+        yield start, min(start + CHUNK_SIZE, total)
+
+
+# ---------- GENERATORS ----------
+def generate_users(rng, n):
+    return pd.DataFrame({
+        "phone": customer_phones(n),
+        "password": [f"pass{i}" for i in range(n)],
+        "points": rng.integers(0, 10_000, size=n),
+    })
+
+def generate_operators():
+    return pd.DataFrame([
+        {"phone": "90001111", "password": "op123"},
+        {"phone": "90002222", "password": "op456"},
+    ])
+
+def generate_restaurants(n):
+    return pd.DataFrame({
+        "phone": restaurant_phones(n),
+        "password": [f"rest{i}" for i in range(n)],
+        "name": [f"Restaurant {i}" for i in range(n)],
+    })
+
+def build_history(past_rests, past_custs, rest, cust, status):
+    """History as the app builds it: restaurant phone on distribution, customer phone on delivery.
+
+    Each past cycle has its own restaurant and customer; the current cycle ends with the present owner(s).
+    """
+    history = []
+    for r, c in zip(past_rests, past_custs):
+        history.append(r)
+        history.append(c)
+    if status == "DISTRIBUTED":
+        history.append(rest)
+    elif status in ("IN_USE", "RETURNED"):
+        history.append(rest)
+        history.append(cust)
+    return str(history)
+
+def generate_containers(rng, n, users, restaurants):
+    for start, stop in chunk_bounds(n):
+        size = stop - start
+        status = rng.choice(CONTAINER_STATUSES, size=size, p=CONTAINER_STATUS_WEIGHTS)
+        times_used = rng.geometric(0.3, size=size) - 1
+        rest = rng.choice(restaurants, size=size)
+        cust = rng.choice(users, size=size)
+        hours = rng.integers(0, MAX_HOURS + 1, size=size)
+
+        with_customer = (status == "IN_USE") | (status == "RETURNED")
+        owner = np.where(with_customer, cust, np.where(status == "DISTRIBUTED", rest, ""))
+        deposit = np.where(with_customer, DEPOSIT, 0.0)
+        # hoursInUse is kept through RETURNED and only reset when a container goes back to CLEAN.
+        hours = np.where(with_customer, hours, 0)
+
+        # One restaurant + customer per past cycle, sliced per container from a flat draw.
+        cycle_ends = np.cumsum(times_used)
+        past_rests = np.split(rng.choice(restaurants, size=cycle_ends[-1]), cycle_ends[:-1])
+        past_custs = np.split(rng.choice(users, size=cycle_ends[-1]), cycle_ends[:-1])
+
+        yield pd.DataFrame({
+            "id": [f"C{i:08d}" for i in range(start, stop)],
+            "status": status,
+            "hoursInUse": hours,
+            "timesUsed": times_used,
+            "owner": owner,
+            "deposit": deposit,
+            "history": [build_history(pr, pc, r, c, s)
+                        for pr, pc, r, c, s in zip(past_rests, past_custs, rest, cust, status)],
+            "startTime": "",
+        })
+
+def generate_orders(rng, n, users, restaurants):
+    for start, stop in chunk_bounds(n):
+        size = stop - start
+        status = rng.choice(ORDER_STATUSES, size=size, p=ORDER_STATUS_WEIGHTS)
+        num_containers = rng.integers(1, 4, size=size).astype(str)
+        yield pd.DataFrame({
+            "customer_phone": rng.choice(users, size=size),
+            "restaurant_phone": rng.choice(restaurants, size=size),
+            "order_text": rng.choice(ORDER_TEXTS, size=size),
+            "status": status,
+            "containers": np.where(status == "DELIVERED", num_containers, ""),
+        })
+
+def generate_requests(rng, n, restaurants):
+    base = pd.Timestamp("2025-01-01")
+    year = 365 * 24 * 3600
+    for start, stop in chunk_bounds(n):
+        size = stop - start
+        idx = rng.integers(0, len(restaurants), size=size)
+        # Each chunk gets its own slice of the year so created_at increases across the whole file;
+        # the app relies on file order for "latest first".
+        offsets = np.sort(rng.integers(start * year // n, stop * year // n, size=size))
+        offsets = pd.to_timedelta(offsets, unit="s")
+        yield pd.DataFrame({
+            "restaurant_phone": restaurants["phone"].values[idx],
+            "restaurant_name": restaurants["name"].values[idx],
+            "num_requested": rng.integers(1, 50, size=size),
+            "status": rng.choice(REQUEST_STATUSES, size=size, p=REQUEST_STATUS_WEIGHTS),
+            "created_at": (base + offsets).strftime("%Y-%m-%d %H:%M:%S"),
+        })
+
+
+# ---------- MAIN ----------
+def generate(tier, out_dir, seed=0):
+    sizes = TIERS[tier]
+    rng = np.random.default_rng(seed)
+    os.makedirs(out_dir, exist_ok=True)
+
+    users = generate_users(rng, sizes["users"])
+    restaurants = generate_restaurants(sizes["restaurants"])
+    users.to_csv(os.path.join(out_dir, "users.csv"), index=False)
+    generate_operators().to_csv(os.path.join(out_dir, "operators.csv"), index=False)
+    restaurants.to_csv(os.path.join(out_dir, "restaurants.csv"), index=False)
+
+    user_phones = users["phone"].values
+    rest_phones = restaurants["phone"].values
+    write_chunks(os.path.join(out_dir, "containers.csv"), CONTAINERS_COLUMNS,
+                 generate_containers(rng, sizes["containers"], user_phones, rest_phones))
+    write_chunks(os.path.join(out_dir, "orders.csv"), ORDERS_COLUMNS,
+                 generate_orders(rng, sizes["orders"], user_phones, rest_phones))
+    write_chunks(os.path.join(out_dir, "requests.csv"), REQUESTS_COLUMNS,
+                 generate_requests(rng, sizes["requests"], restaurants))
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic CSV data for the reusable containers demo.")
+    parser.add_argument("--tier", choices=list(TIERS), default="1k", help="scale tier (number of containers)")
+    parser.add_argument("--out", default=None, help="output directory (default: synthetic_data/<tier>)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed, same seed gives identical files")
+    args = parser.parse_args()
+
+    out_dir = args.out or os.path.join("synthetic_data", args.tier)
+    generate(args.tier, out_dir, args.seed)
+    print(f"Wrote {args.tier} tier to {out_dir}")
+
+if __name__ == "__main__":
+    main()
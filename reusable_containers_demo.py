@@ -3,46 +3,17 @@ import pandas as pd
 import os
 from pathlib import Path
 import random
-import ast
 import base64
 
-# ---------- CSV FILES ----------
-USERS_FILE = "users.csv"
-OPERATORS_FILE = "operators.csv"
-RESTAURANTS_FILE = "restaurants.csv"
-CONTAINERS_FILE = "containers.csv"
-ORDERS_FILE = "orders.csv"
-REQUESTS_FILE = "requests.csv"   # new file for restaurant container requests
-
-# ---------- INITIALIZATION ----------
-def init_csv():
-    if not os.path.exists(USERS_FILE):
-        pd.DataFrame([
-            {"phone": "91234567", "password": "pass123", "points": 0},
-            {"phone": "98765432", "password": "secret", "points": 0}
-        ]).to_csv(USERS_FILE, index=False)
-    if not os.path.exists(OPERATORS_FILE):
-        pd.DataFrame([
-            {"phone": "90001111", "password": "op123"},
-            {"phone": "90002222", "password": "op456"}
-        ]).to_csv(OPERATORS_FILE, index=False)
-    if not os.path.exists(RESTAURANTS_FILE):
-        # If restaurants.csv already exists in your workspace, this won't overwrite.
-        pd.DataFrame([
-            {"phone": "80001111", "password": "restA", "name": "Restaurant A"},
-            {"phone": "80002222", "password": "restB", "name": "Restaurant B"}
-        ]).to_csv(RESTAURANTS_FILE, index=False)
-    if not os.path.exists(CONTAINERS_FILE):
-        pd.DataFrame([
-            {"id": "C001", "status": "CLEAN", "hoursInUse": 0, "timesUsed": 0,
-             "owner": "", "deposit": 0.0, "history": "[]"}
-        ]).to_csv(CONTAINERS_FILE, index=False)
-    if not os.path.exists(ORDERS_FILE):
-        pd.DataFrame(columns=["customer_phone", "restaurant_phone", "order_text", "status", "containers"]) \
-          .to_csv(ORDERS_FILE, index=False)
-    if not os.path.exists(REQUESTS_FILE):
-        # requests: restaurant_phone, num_requested, status (OPEN / FULFILLED), created_at
-        pd.DataFrame(columns=["restaurant_phone", "num_requested", "status", "created_at"]).to_csv(REQUESTS_FILE, index=False)
+from data_io import (
+    init_csv, load_users, save_users, load_operators, load_restaurants,
+    load_orders, save_orders, load_requests, save_requests,
+    load_containers, save_containers, calc_points,
+    find_login, find_by_phone, containers_owned_by, restaurant_stock,
+    take_clean_containers, search_containers, count_by_status,
+    orders_for_customer, orders_for_restaurant, pending_only,
+    open_requests_latest_first,
+)
 
 init_csv()
 
@@ -51,56 +22,6 @@ def image_to_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
 
-def load_users():
-    df = pd.read_csv(USERS_FILE, dtype=str).applymap(lambda x: x.strip() if isinstance(x, str) else x)
-    df["points"] = df["points"].astype(int)
-    return df
-
-def save_users(df):
-    df.to_csv(USERS_FILE, index=False)
-
-def load_operators():
-    df = pd.read_csv(OPERATORS_FILE, dtype=str).applymap(lambda x: x.strip() if isinstance(x, str) else x)
-    return df
-
-def load_restaurants():
-    df = pd.read_csv(RESTAURANTS_FILE, dtype=str).applymap(lambda x: x.strip() if isinstance(x, str) else x)
-    return df
-
-def load_orders():
-    if not os.path.exists(ORDERS_FILE):
-        pd.DataFrame(columns=["customer_phone", "restaurant_phone", "order_text", "status", "containers"]).to_csv(ORDERS_FILE, index=False)
-    return pd.read_csv(ORDERS_FILE, dtype=str)
-
-def save_orders(df):
-    df.to_csv(ORDERS_FILE, index=False)
-
-def load_requests():
-    if not os.path.exists(REQUESTS_FILE):
-        pd.DataFrame(columns=["restaurant_phone", "num_requested", "status", "created_at"]).to_csv(REQUESTS_FILE, index=False)
-    df = pd.read_csv(REQUESTS_FILE, dtype=str).applymap(lambda x: x.strip() if isinstance(x, str) else x)
-    return df
-
-def save_requests(df):
-    df.to_csv(REQUESTS_FILE, index=False)
-
-def load_containers():
-    df = pd.read_csv(CONTAINERS_FILE, dtype=str).applymap(lambda x: x.strip() if isinstance(x, str) else x)
-    # ensure columns types
-    df["hoursInUse"] = df["hoursInUse"].astype(int)
-    df["timesUsed"] = df["timesUsed"].astype(int)
-    df["deposit"] = df["deposit"].astype(float)
-    df["history"] = df["history"].apply(lambda x: ast.literal_eval(x) if x else [])
-    return df
-
-def save_containers(df):
-    df["history"] = df["history"].apply(str)
-    df.to_csv(CONTAINERS_FILE, index=False)
-
-def calc_points(hours, clean=True):
-    base = max(0, (168 - hours) * 1000 / 168)
-    return int(base if clean else base / 2)
-
 # ---------- SESSION STATE ----------
 if "role" not in st.session_state: st.session_state.role = None
 if "phone" not in st.session_state: st.session_state.phone = None
@@ -132,7 +53,7 @@ if st.session_state.role is None:
         if submitted:
             if role == "Customer":
                 users = load_users()
-                match = users[(users["phone"] == phone) & (users["password"] == password)]
+                match = find_login(users, phone, password)
                 if not match.empty:
                     st.session_state.role = "Customer"
                     st.session_state.phone = phone
@@ -142,7 +63,7 @@ if st.session_state.role is None:
                     st.error("Invalid customer credentials")
             elif role == "Operator":
                 operators = load_operators()
-                match = operators[(operators["phone"] == phone) & (operators["password"] == password)]
+                match = find_login(operators, phone, password)
                 if not match.empty:
                     st.session_state.role = "Operator"
                     st.session_state.phone = phone
@@ -152,7 +73,7 @@ if st.session_state.role is None:
                     st.error("Invalid operator credentials")
             else:  # Restaurant
                 restaurants = load_restaurants()
-                match = restaurants[(restaurants["phone"] == phone) & (restaurants["password"] == password)]
+                match = find_login(restaurants, phone, password)
                 if not match.empty:
                     st.session_state.role = "Restaurant"
                     st.session_state.phone = phone
@@ -182,9 +103,9 @@ if st.session_state.role is None:
 # -----------------------
 if st.session_state.role == "Customer":
     users = load_users()
-    user = users[users["phone"] == st.session_state.phone].iloc[0]
+    user = find_by_phone(users, st.session_state.phone).iloc[0]
     containers = load_containers()
-    my_containers = containers[containers["owner"] == st.session_state.phone]
+    my_containers = containers_owned_by(containers, st.session_state.phone)
     orders = load_orders()
     restaurants = load_restaurants()
 
@@ -307,10 +228,10 @@ if st.session_state.role == "Customer":
     st.markdown("### 📜 Order History")
     # --- Pending Orders as cards ---
     orders = load_orders()  # reload to ensure fresh
-    customer_orders = orders[orders["customer_phone"]==st.session_state.phone]
+    customer_orders = orders_for_customer(orders, st.session_state.phone)
     restaurants = load_restaurants()
 
-    pending_orders = customer_orders[customer_orders["status"] == "PENDING"]
+    pending_orders = pending_only(customer_orders)
     if not pending_orders.empty:
         st.markdown("#### 🕒 Pending Orders")
         # Sort latest first
@@ -394,7 +315,7 @@ if st.session_state.role == "Operator":
     # Container summary by status (horizontal)
     st.subheader("📦 Container Summary")
     col1, col2, col3, col4 = st.columns(4)
-    status_counts = containers["status"].value_counts()
+    status_counts = count_by_status(containers)
 
     with col1:
         st.metric("CLEAN", status_counts.get("CLEAN", 0))
@@ -418,7 +339,7 @@ if st.session_state.role == "Operator":
     if st.session_state.get("page") == "redistribute_page":
         st.header("Redistribute Requests")
         requests = load_requests()
-        open_requests = requests[requests["status"] == "OPEN"].iloc[::-1]  # latest first
+        open_requests = open_requests_latest_first(requests)
         if not open_requests.empty:
             for idx, req in open_requests.iterrows():
                 rest_phone = req["restaurant_phone"]
@@ -430,7 +351,7 @@ if st.session_state.role == "Operator":
                     st.write(f"**Requested:** {num_req} containers")
                     if st.button(f"Distribute to {rest_name} (req {idx})"):
                         containers = load_containers()
-                        available = containers[containers["status"] == "CLEAN"].head(num_req)
+                        available = take_clean_containers(containers, num_req)
                         if len(available) < num_req:
                             st.error("Not enough clean containers available to fulfill request.")
                         else:
@@ -471,7 +392,7 @@ if st.session_state.role == "Operator":
 
     # -------------------- Container Search --------------------
     search = st.text_input("Search Container ID")
-    results = containers[containers["id"].str.contains(search)] if search else containers
+    results = search_containers(containers, search)
 
     # -------------------- Containers by Status (4 Columns) --------------------
     st.subheader("Manage Containers")
@@ -555,13 +476,13 @@ if st.session_state.role == "Operator":
 # ---------- RESTAURANT VIEW ----------
 if st.session_state.role == "Restaurant":
     restaurants = load_restaurants()
-    my_rest = restaurants[restaurants["phone"] == st.session_state.phone].iloc[0]
+    my_rest = find_by_phone(restaurants, st.session_state.phone).iloc[0]
     st.header(f"🍴 Restaurant Home - {my_rest['name']}")
 
     containers = load_containers()
 
     # Show restaurant's container stock (distributed containers)
-    my_stock = containers[(containers["status"] == "DISTRIBUTED") & (containers["owner"] == st.session_state.phone)]
+    my_stock = restaurant_stock(containers, st.session_state.phone)
     st.metric("📦 Containers Available", len(my_stock))
 
     # Request more containers button
@@ -597,11 +518,11 @@ if st.session_state.role == "Restaurant":
         st.rerun()
 
     orders = load_orders()
-    my_orders = orders[(orders["restaurant_phone"] == st.session_state.phone)].iloc[::-1]  # latest first
+    my_orders = orders_for_restaurant(orders, st.session_state.phone)
 
     # ---------- Active Orders Cards (latest 5) ----------
     st.subheader("📥 Pending Orders")
-    pending_orders = my_orders[my_orders["status"] == "PENDING"]
+    pending_orders = pending_only(my_orders)
     if not pending_orders.empty:
         for idx, order in pending_orders.head(5).iterrows():
             with st.container(border=True):
@@ -609,10 +530,7 @@ if st.session_state.role == "Restaurant":
                 st.write(f"**Order:** {order['order_text']}")
 
                 # Show available stock
-                available = containers[
-                    (containers["status"] == "DISTRIBUTED") & 
-                    (containers["owner"] == st.session_state.phone)
-                ]
+                available = restaurant_stock(containers, st.session_state.phone)
 
                 if available.empty:
                     st.warning("No distributed containers in your possession!")
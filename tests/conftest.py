@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+import data_io
+import generate_synthetic_data
+
+# Tiers that take minutes and gigabytes to generate, only run with --large-tiers.
+LARGE_TIERS = {"1m", "10m"}
+
+DATA_FILES = {
+    "USERS_FILE": "users.csv",
+    "OPERATORS_FILE": "operators.csv",
+    "RESTAURANTS_FILE": "restaurants.csv",
+    "CONTAINERS_FILE": "containers.csv",
+    "ORDERS_FILE": "orders.csv",
+    "REQUESTS_FILE": "requests.csv",
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--large-tiers", action="store_true", default=False,
+                     help="also run the 1m and 10m synthetic data tiers")
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize any test that asks for `tier` over every scale tier."""
+    if "tier" in metafunc.fixturenames:
+        metafunc.parametrize("tier", [
+            pytest.param(tier, marks=pytest.mark.large_tier) if tier in LARGE_TIERS else tier
+            for tier in generate_synthetic_data.TIERS
+        ])
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--large-tiers"):
+        return
+    skip = pytest.mark.skip(reason="large tier, use --large-tiers to run")
+    for item in items:
+        if "large_tier" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def generated_tiers(tmp_path_factory):
+    """Generate each tier once per session, on first use."""
+    dirs = {}
+
+    def get(tier):
+        if tier not in dirs:
+            dirs[tier] = str(tmp_path_factory.mktemp(f"synthetic_{tier}"))
+            generate_synthetic_data.generate(tier, dirs[tier], seed=0)
+        return dirs[tier]
+
+    return get
+
+
+@pytest.fixture
+def use_data_dir(monkeypatch):
+    """Return a function that redirects every data_io file constant into a directory."""
+    def point_at(directory):
+        for name, filename in DATA_FILES.items():
+            monkeypatch.setattr(data_io, name, os.path.join(directory, filename))
+        return directory
+
+    return point_at
+
+
+@pytest.fixture
+def tier_dir(tier, generated_tiers, use_data_dir):
+    """data_io pointed at the generated data for the current tier."""
+    return use_data_dir(generated_tiers(tier))
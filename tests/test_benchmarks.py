@@ -0,0 +1,92 @@
+"""pytest-benchmark timings for the data_io loaders, savers and the view-level filters.
+
+1m and 10m tiers are skipped unless --large-tiers is given.
+"""
+import data_io
+
+
+# ---------- LOADERS ----------
+def test_load_containers(benchmark, tier_dir):
+    benchmark(data_io.load_containers)
+
+def test_load_orders(benchmark, tier_dir):
+    benchmark(data_io.load_orders)
+
+def test_load_users(benchmark, tier_dir):
+    benchmark(data_io.load_users)
+
+def test_load_requests(benchmark, tier_dir):
+    benchmark(data_io.load_requests)
+
+
+# ---------- SAVE PATHS ----------
+# Saves write into tmp_path so the shared generated tier stays untouched.
+def bench_save(benchmark, save, df):
+    benchmark.pedantic(save, setup=lambda: ((df.copy(),), {}), rounds=3)
+
+def test_save_users(benchmark, tier_dir, monkeypatch, tmp_path):
+    users = data_io.load_users()
+    monkeypatch.setattr(data_io, "USERS_FILE", str(tmp_path / "users.csv"))
+    bench_save(benchmark, data_io.save_users, users)
+
+def test_save_containers(benchmark, tier_dir, monkeypatch, tmp_path):
+    containers = data_io.load_containers()
+    monkeypatch.setattr(data_io, "CONTAINERS_FILE", str(tmp_path / "containers.csv"))
+    bench_save(benchmark, data_io.save_containers, containers)
+
+def test_save_orders(benchmark, tier_dir, monkeypatch, tmp_path):
+    orders = data_io.load_orders()
+    monkeypatch.setattr(data_io, "ORDERS_FILE", str(tmp_path / "orders.csv"))
+    bench_save(benchmark, data_io.save_orders, orders)
+
+def test_save_requests(benchmark, tier_dir, monkeypatch, tmp_path):
+    requests = data_io.load_requests()
+    monkeypatch.setattr(data_io, "REQUESTS_FILE", str(tmp_path / "requests.csv"))
+    bench_save(benchmark, data_io.save_requests, requests)
+
+
+# ---------- VIEW QUERIES ----------
+# The app calls these same data_io helpers, so the timings follow any change to the filters.
+def test_login_lookup(benchmark, tier_dir):
+    users = data_io.load_users()
+    phone, password = users[["phone", "password"]].iloc[-1]
+    benchmark(data_io.find_login, users, phone, password)
+
+def test_customer_lookup(benchmark, tier_dir):
+    users = data_io.load_users()
+    benchmark(data_io.find_by_phone, users, users["phone"].iloc[-1])
+
+def test_customer_containers(benchmark, tier_dir):
+    containers = data_io.load_containers()
+    benchmark(data_io.containers_owned_by, containers, data_io.load_users()["phone"].iloc[0])
+
+def test_customer_orders(benchmark, tier_dir):
+    orders = data_io.load_orders()
+    benchmark(data_io.orders_for_customer, orders, data_io.load_users()["phone"].iloc[0])
+
+def test_customer_pending_orders(benchmark, tier_dir):
+    orders = data_io.load_orders()
+    phone = data_io.load_users()["phone"].iloc[0]
+    benchmark(lambda: data_io.pending_only(data_io.orders_for_customer(orders, phone)))
+
+def test_operator_status_counts(benchmark, tier_dir):
+    benchmark(data_io.count_by_status, data_io.load_containers())
+
+def test_operator_open_requests(benchmark, tier_dir):
+    benchmark(data_io.open_requests_latest_first, data_io.load_requests())
+
+def test_operator_take_clean_containers(benchmark, tier_dir):
+    benchmark(data_io.take_clean_containers, data_io.load_containers(), 50)
+
+def test_operator_search_containers(benchmark, tier_dir):
+    containers = data_io.load_containers()
+    # Partial id, as typed into the search box; matches ~1% of the fleet.
+    benchmark(data_io.search_containers, containers, containers["id"].iloc[-1][:-2])
+
+def test_restaurant_stock(benchmark, tier_dir):
+    containers = data_io.load_containers()
+    benchmark(data_io.restaurant_stock, containers, data_io.load_restaurants()["phone"].iloc[0])
+
+def test_restaurant_orders(benchmark, tier_dir):
+    orders = data_io.load_orders()
+    benchmark(data_io.orders_for_restaurant, orders, data_io.load_restaurants()["phone"].iloc[0])
@@ -0,0 +1,63 @@
+import hashlib
+
+import pandas as pd
+
+import data_io
+import generate_synthetic_data
+
+
+def file_hashes(directory):
+    return {path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+            for path in sorted(directory.iterdir())}
+
+
+def test_same_seed_gives_identical_files(tmp_path):
+    generate_synthetic_data.generate("1k", str(tmp_path / "a"), seed=0)
+    generate_synthetic_data.generate("1k", str(tmp_path / "b"), seed=0)
+    assert file_hashes(tmp_path / "a") == file_hashes(tmp_path / "b")
+
+
+def test_files_load_with_app_loaders(generated_tiers, use_data_dir):
+    use_data_dir(generated_tiers("1k"))
+    sizes = generate_synthetic_data.TIERS["1k"]
+
+    users = data_io.load_users()
+    assert list(users.columns) == generate_synthetic_data.USERS_COLUMNS
+    assert users["points"].dtype == "int64"
+    assert not users["phone"].isin(data_io.load_operators()["phone"]).any()
+
+    containers = data_io.load_containers()
+    assert list(containers.columns) == generate_synthetic_data.CONTAINERS_COLUMNS
+    assert len(containers) == sizes["containers"]
+    assert containers["hoursInUse"].dtype == "int64"
+    assert containers["timesUsed"].dtype == "int64"
+    assert containers["deposit"].dtype == "float64"
+    assert containers["history"].map(lambda h: isinstance(h, list)).all()
+
+    orders = data_io.load_orders()
+    assert list(orders.columns) == generate_synthetic_data.ORDERS_COLUMNS
+    assert len(orders) == sizes["orders"]
+
+    requests = data_io.load_requests()
+    assert list(requests.columns) == generate_synthetic_data.REQUESTS_COLUMNS
+    assert requests["num_requested"].astype(int).gt(0).all()
+    assert pd.to_datetime(requests["created_at"]).is_monotonic_increasing
+
+
+def test_chunked_write_across_boundaries(monkeypatch, tmp_path):
+    # Small chunks so every table spans several write_chunks passes.
+    monkeypatch.setattr(generate_synthetic_data, "CHUNK_SIZE", 7)
+    generate_synthetic_data.generate("1k", str(tmp_path), seed=0)
+    sizes = generate_synthetic_data.TIERS["1k"]
+
+    containers = pd.read_csv(tmp_path / "containers.csv", dtype=str)
+    orders = pd.read_csv(tmp_path / "orders.csv", dtype=str)
+    requests = pd.read_csv(tmp_path / "requests.csv", dtype=str)
+
+    assert len(containers) == sizes["containers"]
+    assert len(orders) == sizes["orders"]
+    assert len(requests) == sizes["requests"]
+    # A repeated header would show up as a data row.
+    assert not (containers["id"] == "id").any()
+    assert containers["id"].is_unique
+    assert pd.to_datetime(requests["created_at"]).is_monotonic_increasing